@@ -7,11 +7,12 @@ portfolio metrics, business metrics, and insights generation.
 
 from .loan_tape_analyzer import LoanPortfolioAnalyzer
 from .loan_tape_data_processor import LoanDataProcessor
-from .loan_tape_metrics import PortfolioMetricsCalculator, BusinessMetricsCalculator
+from .loan_tape_metrics import PortfolioMetricsCalculator, BusinessMetricsCalculator, preprocess_loan_tape
 
 __all__ = [
     'LoanPortfolioAnalyzer',
     'LoanDataProcessor', 
     'PortfolioMetricsCalculator',
-    'BusinessMetricsCalculator'
+    'BusinessMetricsCalculator',
+    'preprocess_loan_tape'
 ] 
\ No newline at end of file
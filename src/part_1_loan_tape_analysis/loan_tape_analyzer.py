@@ -5,20 +5,37 @@ Main analyzer class for loan portfolio analysis (Part 1).
 import pandas as pd
 from typing import Dict, List, Optional
 from .loan_tape_data_processor import LoanDataProcessor
-from .loan_tape_metrics import PortfolioMetricsCalculator, BusinessMetricsCalculator, YieldMetricsCalculator
+from .loan_tape_metrics import (
+    PortfolioMetricsCalculator, BusinessMetricsCalculator, YieldMetricsCalculator, preprocess_loan_tape
+)
 
 
 class LoanPortfolioAnalyzer:
-    """Main class for loan portfolio analysis (Part 1)."""
+    """
+    Main class for loan portfolio analysis (Part 1).
+    
+    Only the LOAN_TAPE_COLUMNS present in the file are loaded, so ``data``
+    holds that subset of the loan tape rather than every column. Load the
+    file with LoanDataProcessor.load_loan_tape for the full tape.
+    """
+    
+    # Loan tape columns read by the metrics calculators and insights; the rest are never used
+    LOAN_TAPE_COLUMNS = (
+        'snapshotBeginningAt', 'snapshotEndingAt', 'accountActivatedAt',
+        'businessGuid', 'capitalAccountGuid', 'accountEndingStatus', 'accountType',
+        'accountDailyAveragePrincipalBalance', 'lineDailyAveragePrincipalBalance',
+        'cardDailyAveragePrincipalBalance', 'lineFeesAccrued', 'cardNetInterchangeAccrued',
+        'cardRewardsAccrued'
+    )
     
     def __init__(self, data_path: str):
         """
         Initialize the analyzer with loan tape data.
         
         Args:
-            data_path: Path to the loan tape CSV file
+            data_path: Path to the loan tape CSV file; only LOAN_TAPE_COLUMNS are kept
         """
-        self.data = LoanDataProcessor.load_loan_tape(data_path)
+        self.data = LoanDataProcessor.load_loan_tape(data_path, usecols=self.LOAN_TAPE_COLUMNS)
         self.portfolio_metrics = None
         self.business_metrics = None
         self.yield_metrics = None
@@ -37,19 +54,23 @@ class LoanPortfolioAnalyzer:
         Returns:
             Dictionary with analysis results
         """
+        # Preprocess once for all calculators; redone on every call so edits to
+        # self.data are always picked up
+        prepared = preprocess_loan_tape(self.data)
+        
         # Calculate portfolio metrics
         self.portfolio_metrics = PortfolioMetricsCalculator.calculate_portfolio_metrics(
-            self.data, start_date, end_date
+            prepared, start_date, end_date, preprocessed=True
         )
         
         # Calculate portfolio-wide rates
         self.portfolio_wide_rates = PortfolioMetricsCalculator.calculate_portfolio_wide_rates(self.data)
         
         # Calculate business metrics
-        self.business_metrics = BusinessMetricsCalculator.calculate_business_metrics(self.data)
+        self.business_metrics = BusinessMetricsCalculator.calculate_business_metrics(prepared, preprocessed=True)
         
         # Calculate yield metrics
-        self.yield_metrics = YieldMetricsCalculator(self.data).calculate_all_yield_metrics()
+        self.yield_metrics = YieldMetricsCalculator(prepared, preprocessed=True).calculate_all_yield_metrics()
         
         # Generate insights
         self.insights = self._generate_insights()
@@ -93,7 +114,8 @@ class LoanPortfolioAnalyzer:
         Get yield metrics.
         
         Args:
-            filter_active: Whether to filter for active accounts only
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which the yield formulas never read
             
         Returns:
             Dictionary with all yield metrics
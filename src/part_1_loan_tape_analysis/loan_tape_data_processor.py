@@ -4,30 +4,70 @@ Data processing utilities for loan tape analysis.
 
 import pandas as pd
 import re
-from typing import Optional
+from typing import Optional, Sequence
 from datetime import datetime
 
+from ..utils.load_cache import file_signature, get_cached_frame, load_cache_key, store_cached_frame
+
 
 class LoanDataProcessor:
     """Handle data loading and preprocessing for loan tape analysis."""
     
+    # Columns parsed as dates
+    DATE_COLUMNS = [
+        'snapshotBeginningAt', 'snapshotEndingAt', 
+        'accountActivatedAt', 'accountDefaultedAt', 
+        'accountTerminatedAt', 'accountDelinquentAt',
+        'lineOldestUnpaidOriginationAt'
+    ]
+    
+    # Columns holding currency strings such as "$750,000.00"
+    CURRENCY_COLUMNS = [
+        'accountEndingLimit', 'accountDailyAveragePrincipalBalance',
+        'lineBeginningPrincipalBalance', 'lineBeginningFeesBalance',
+        'linePrincipalOriginated', 'linePrincipalRepaymentsPaid',
+        'lineFeesAccrued', 'lineFeesPaid', 'lineEndingFeesBalance',
+        'lineEndingPrincipalBalance', 'lineDailyAveragePrincipalBalance',
+        'cardBeginningPrincipalBalance', 'cardPrincipalOriginated',
+        'cardPrincipalRepaymentsPaid', 'cardNetInterchangeAccrued',
+        'cardRewardsAccrued', 'cardEndingPrincipalBalance',
+        'cardDailyAveragePrincipalBalance'
+    ]
+    
     @staticmethod
-    def load_loan_tape(file_path: str) -> pd.DataFrame:
+    def load_loan_tape(file_path: str, usecols: Optional[Sequence[str]] = None,
+                       *, cache: bool = False) -> pd.DataFrame:
         """
         Load and preprocess loan tape CSV file.
         
         Args:
             file_path: Path to the loan tape CSV file
+            usecols: Optional subset of columns to read; names missing from the
+                file are skipped. All columns by default
+            cache: Keep the result and reuse it for later loads of the same,
+                unchanged file (same mtime and size); off by default since each
+                entry holds a copy of the frame
             
         Returns:
             Preprocessed DataFrame with proper data types
         """
+        if cache:
+            cache_key = load_cache_key('loan_tape', file_path, usecols)
+            signature = file_signature(file_path)
+            cached = get_cached_frame(cache_key, signature)
+            if cached is not None:
+                return cached
+        
         # Load the CSV file
-        df = pd.read_csv(file_path)
+        wanted = frozenset(usecols) if usecols else None
+        df = pd.read_csv(file_path, usecols=(lambda column: column in wanted) if wanted else None)
         
         # Preprocess the data
         df = LoanDataProcessor._preprocess_data(df)
         
+        if cache:
+            store_cached_frame(cache_key, signature, df)
+        
         return df
     
     @staticmethod
@@ -42,31 +82,12 @@ class LoanDataProcessor:
             Preprocessed DataFrame
         """
         # Convert date columns
-        date_columns = [
-            'snapshotBeginningAt', 'snapshotEndingAt', 
-            'accountActivatedAt', 'accountDefaultedAt', 
-            'accountTerminatedAt', 'accountDelinquentAt',
-            'lineOldestUnpaidOriginationAt'
-        ]
-        
-        for col in date_columns:
+        for col in LoanDataProcessor.DATE_COLUMNS:
             if col in df.columns:
                 df[col] = pd.to_datetime(df[col], errors='coerce')
         
         # Parse currency columns
-        currency_columns = [
-            'accountEndingLimit', 'accountDailyAveragePrincipalBalance',
-            'lineBeginningPrincipalBalance', 'lineBeginningFeesBalance',
-            'linePrincipalOriginated', 'linePrincipalRepaymentsPaid',
-            'lineFeesAccrued', 'lineFeesPaid', 'lineEndingFeesBalance',
-            'lineEndingPrincipalBalance', 'lineDailyAveragePrincipalBalance',
-            'cardBeginningPrincipalBalance', 'cardPrincipalOriginated',
-            'cardPrincipalRepaymentsPaid', 'cardNetInterchangeAccrued',
-            'cardRewardsAccrued', 'cardEndingPrincipalBalance',
-            'cardDailyAveragePrincipalBalance'
-        ]
-        
-        for col in currency_columns:
+        for col in LoanDataProcessor.CURRENCY_COLUMNS:
             if col in df.columns:
                 df[col] = df[col].apply(LoanDataProcessor.parse_currency)
         
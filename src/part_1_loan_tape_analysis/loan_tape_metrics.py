@@ -9,6 +9,64 @@ from datetime import datetime
 from functools import lru_cache
 import re
 
+from .loan_tape_data_processor import LoanDataProcessor
+
+
+# Status buckets used by the fused per-status sums (everything else is bucket 3)
+_STATUS_BUCKETS = {'Current': 0, 'Delinquent': 1, 'Default': 2}
+
+# Business dashboard status priority: Closed > Current > Delinquent > Default > ChargedOff
+_STATUS_PRIORITY = {'Closed': 1, 'Current': 2, 'Delinquent': 3, 'Default': 4, 'ChargedOff': 5}
+
+
+def preprocess_loan_tape(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Preprocess loan tape data once for all metric calculators.
+    
+    Parses currency and date columns, casts businessGuid to a categorical and
+    adds the derived columns shared by the calculators (revenue, net_revenue,
+    period_days and status_code) for the inputs present. The result can be handed to several
+    calculators with preprocessed=True so the work is done only once.
+    
+    Args:
+        df: Loan tape data, raw or already loaded by LoanDataProcessor
+        
+    Returns:
+        Preprocessed DataFrame
+    """
+    result = df.copy()
+    
+    # Parse currency columns; loaded data is already numeric and only needs NaN filling
+    for col in LoanDataProcessor.CURRENCY_COLUMNS:
+        if col in result.columns:
+            if pd.api.types.is_numeric_dtype(result[col]):
+                result[col] = result[col].astype(np.float64).fillna(0.0)
+            else:
+                result[col] = result[col].map(LoanDataProcessor.parse_currency)
+    
+    # Parse date columns
+    for col in LoanDataProcessor.DATE_COLUMNS:
+        if col in result.columns and not pd.api.types.is_datetime64_any_dtype(result[col]):
+            result[col] = pd.to_datetime(result[col], errors='coerce')
+    
+    # Hash business keys as integer category codes when grouping
+    if 'businessGuid' in result.columns:
+        result['businessGuid'] = result['businessGuid'].astype('category')
+    
+    # Derived columns, added only when their inputs are present
+    if 'lineFeesAccrued' in result.columns and 'cardNetInterchangeAccrued' in result.columns:
+        result['revenue'] = result['lineFeesAccrued'] + result['cardNetInterchangeAccrued']
+        if 'cardRewardsAccrued' in result.columns:
+            result['net_revenue'] = result['revenue'] - result['cardRewardsAccrued']
+    
+    if 'snapshotBeginningAt' in result.columns and 'snapshotEndingAt' in result.columns:
+        result['period_days'] = (result['snapshotEndingAt'] - result['snapshotBeginningAt']).dt.days.clip(lower=1)
+    
+    if 'accountEndingStatus' in result.columns:
+        result['status_code'] = result['accountEndingStatus'].map(_STATUS_BUCKETS).fillna(3).astype(np.int8)
+    
+    return result
+
 
 class PortfolioMetricsCalculator:
     """Calculate portfolio-level metrics."""
@@ -16,7 +74,8 @@ class PortfolioMetricsCalculator:
     @staticmethod
     def calculate_portfolio_metrics(data: pd.DataFrame, 
                                  start_date: Optional[str] = None,
-                                 end_date: Optional[str] = None) -> List[Dict]:
+                                 end_date: Optional[str] = None,
+                                 *, preprocessed: bool = False) -> List[Dict]:
         """
         Calculate portfolio-level metrics by month.
         
@@ -24,81 +83,70 @@ class PortfolioMetricsCalculator:
             data: Preprocessed loan tape data
             start_date: Optional start date filter (YYYY-MM format)
             end_date: Optional end date filter (YYYY-MM format)
+            preprocessed: Whether data already went through preprocess_loan_tape
             
         Returns:
             List of portfolio metrics by month
         """
+        if not preprocessed:
+            data = preprocess_loan_tape(data)
+        
         # Filter by date range if provided
         if start_date or end_date:
             data = PortfolioMetricsCalculator._filter_by_date_range(data, start_date, end_date)
         
-        # Group by month
-        data['month'] = data['snapshotEndingAt'].dt.to_period('M')
-        
-        # Calculate metrics by month
-        monthly_metrics = []
-        for month, group in data.groupby('month'):
-            metrics = PortfolioMetricsCalculator._calculate_monthly_metrics(group)
-            metrics['month'] = month
-            monthly_metrics.append(metrics)
-        
-        return monthly_metrics
-    
-    @staticmethod
-    def _calculate_monthly_metrics(group: pd.DataFrame) -> Dict:
-        """
-        Calculate metrics for a specific month using industry-standard approach.
-        
-        Args:
-            group: DataFrame for a specific month
-            
-        Returns:
-            Dictionary with monthly metrics
-        """
-        # Count accounts by status
-        total_accounts = len(group)
-        delinquent_accounts = len(group[group['accountEndingStatus'] == 'Delinquent'])
-        defaulted_accounts = len(group[group['accountEndingStatus'] == 'Default'])
-        charged_off_accounts = len(group[group['accountEndingStatus'] == 'ChargedOff'])
-        closed_accounts = len(group[group['accountEndingStatus'] == 'Closed'])
-        current_accounts = len(group[group['accountEndingStatus'] == 'Current'])
-        
-        # Calculate rates
-        delinquency_rate = delinquent_accounts / total_accounts if total_accounts > 0 else 0
-        default_rate = defaulted_accounts / total_accounts if total_accounts > 0 else 0
-        charge_off_rate = charged_off_accounts / total_accounts if total_accounts > 0 else 0
-        
+        month = data['snapshotEndingAt'].dt.to_period('M').rename('month')
+        status = data['accountEndingStatus']
+
+        # Count accounts by month and status in a single pass
+        total_accounts = data.groupby(month).size()
+        counts = pd.crosstab(month, status).reindex(
+            index=total_accounts.index,
+            columns=['Current', 'Delinquent', 'Default', 'ChargedOff', 'Closed'],
+            fill_value=0
+        )
+
+        # Sum balances and revenue by month and status
+        sums = data.groupby([month, status], observed=True)[
+            ['accountDailyAveragePrincipalBalance', 'lineFeesAccrued', 'cardNetInterchangeAccrued']
+        ].sum().unstack(fill_value=0)
+
+        def _status_sum(column: str, statuses: List[str]) -> pd.Series:
+            return (sums[column].reindex(index=total_accounts.index, columns=statuses, fill_value=0)
+                    .sum(axis=1))
+
         # Calculate portfolio size using industry-standard approach
         # Denominator: balances including Current, Delinquent, Default
-        denom_mask = group['accountEndingStatus'].isin(['Current', 'Delinquent', 'Default'])
-        portfolio_size = group.loc[denom_mask, 'accountDailyAveragePrincipalBalance'].sum()
-        
+        portfolio_size = _status_sum('accountDailyAveragePrincipalBalance', ['Current', 'Delinquent', 'Default'])
+
         # Calculate revenue using industry-standard approach
         # Numerator: revenue only from Current and Delinquent
-        num_mask = group['accountEndingStatus'].isin(['Current', 'Delinquent'])
-        total_revenue = (group.loc[num_mask, 'lineFeesAccrued'].sum() + 
-                        group.loc[num_mask, 'cardNetInterchangeAccrued'].sum())
-        
-        # Calculate yields using industry-standard approach
-        gross_yield = (total_revenue / portfolio_size) * 12 if portfolio_size > 0 else 0  # Monthly annualization
+        total_revenue = (_status_sum('lineFeesAccrued', ['Current', 'Delinquent']) +
+                         _status_sum('cardNetInterchangeAccrued', ['Current', 'Delinquent']))
+
+        # Calculate yields using industry-standard approach (monthly annualization)
+        gross_yield = (total_revenue / portfolio_size * 12).where(portfolio_size > 0, 0.0)
         # Net yield = gross yield - (SOFR + 5%), assuming SOFR is ~5% currently
         net_yield = gross_yield - 0.10  # 10% cost of capital
-        
-        return {
+
+        monthly_metrics = pd.DataFrame({
             'total_accounts': total_accounts,
-            'current_accounts': current_accounts,
-            'delinquent_accounts': delinquent_accounts,
-            'defaulted_accounts': defaulted_accounts,
-            'charged_off_accounts': charged_off_accounts,
-            'closed_accounts': closed_accounts,
-            'delinquency_rate': delinquency_rate,
-            'default_rate': default_rate,
-            'charge_off_rate': charge_off_rate,
+            'current_accounts': counts['Current'],
+            'delinquent_accounts': counts['Delinquent'],
+            'defaulted_accounts': counts['Default'],
+            'charged_off_accounts': counts['ChargedOff'],
+            'closed_accounts': counts['Closed'],
+            'delinquency_rate': counts['Delinquent'] / total_accounts,
+            'default_rate': counts['Default'] / total_accounts,
+            'charge_off_rate': counts['ChargedOff'] / total_accounts,
             'portfolio_size': portfolio_size,
             'total_revenue': total_revenue,
             'gross_yield': gross_yield,
             'net_yield': net_yield
-        }
+        })
+        monthly_metrics['month'] = monthly_metrics.index
+
+        return monthly_metrics.to_dict('records')
     
     @staticmethod
     def _filter_by_date_range(data: pd.DataFrame, 
@@ -174,62 +222,67 @@ class YieldMetricsCalculator:
     - Closed: Exclude from both numerator and denominator
     """
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, *, preprocessed: bool = False):
         """
         Initialize calculator with preprocessed data.
         
         Args:
             data: Clean DataFrame with loan tape data
+            preprocessed: Whether data already went through preprocess_loan_tape
         """
-        self.raw_data = data.copy()
-        self.data = self._preprocess_data()
-        
-    def _parse_currency(self, value) -> float:
-        """Parse currency string to float."""
-        if pd.isna(value) or value == '':
-            return 0.0
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            cleaned = re.sub(r'[$,]', '', value.strip())
-            try:
-                return float(cleaned)
-            except ValueError:
-                return 0.0
-        return 0.0
+        self.raw_data = data
+        self.data = data if preprocessed else preprocess_loan_tape(data)
+        self._sums = None
     
-    def _preprocess_data(self) -> pd.DataFrame:
-        """Preprocess data once for all calculations."""
-        df = self.raw_data.copy()
-        
-        # Parse currency columns
-        currency_columns = [
-            'lineFeesAccrued', 'cardNetInterchangeAccrued', 'cardRewardsAccrued',
-            'lineDailyAveragePrincipalBalance', 'cardDailyAveragePrincipalBalance',
-            'accountDailyAveragePrincipalBalance'
-        ]
+    def _compute_sums(self) -> Dict[str, np.ndarray]:
+        """
+        Sum every yield input by status bucket in a single pass (cached).
         
-        for col in currency_columns:
-            if col in df.columns:
-                df[col] = df[col].apply(self._parse_currency)
+        Buckets are indexed as 0=Current, 1=Delinquent, 2=Default, 3=other.
+        ChargedOff and Closed accounts fall into the "other" bucket, which no
+        yield formula reads, so the active-account filter needs no extra mask.
         
-        # Parse date columns
-        date_columns = ['snapshotBeginningAt', 'snapshotEndingAt', 'accountActivatedAt']
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col])
+        Returns:
+            Dictionary mapping each input to an array of per-bucket sums
+        """
+        if self._sums is None:
+            df = self.data
+            codes = df['status_code'].to_numpy(dtype=np.intp)
+            period_days = df['period_days']
+            
+            inputs = {
+                'accountDailyAveragePrincipalBalance': df['accountDailyAveragePrincipalBalance'],
+                'lineDailyAveragePrincipalBalance': df['lineDailyAveragePrincipalBalance'],
+                'cardDailyAveragePrincipalBalance': df['cardDailyAveragePrincipalBalance'],
+                'lineFeesAccrued': df['lineFeesAccrued'],
+                'cardNetInterchangeAccrued': df['cardNetInterchangeAccrued'],
+                'cardRewardsAccrued': df['cardRewardsAccrued'],
+                'period_days': period_days,
+                'period_days_count': period_days.notna(),
+                'line_revenue_accounts': df['lineFeesAccrued'] > 0,
+                'line_balance_accounts': df['lineDailyAveragePrincipalBalance'] > 0,
+                'card_revenue_accounts': df['cardNetInterchangeAccrued'] > 0,
+                'card_balance_accounts': df['cardDailyAveragePrincipalBalance'] > 0
+            }
+            
+            sums = {'accounts': np.bincount(codes, minlength=4)}
+            
+            for name, values in inputs.items():
+                weights = values.to_numpy(dtype=np.float64, na_value=0.0)
+                sums[name] = np.bincount(codes, weights=weights, minlength=4)
+            
+            self._sums = sums
         
-        return df
+        return self._sums
     
-    def _get_filtered_data(self, filter_active: bool = True) -> pd.DataFrame:
-        """Get filtered data based on criteria."""
-        df = self.data.copy()
-        
-        if filter_active:
-            # Filter out charged off accounts for cleaner analysis
-            df = df[df['accountEndingStatus'] != 'ChargedOff']
-        
-        return df
+    @staticmethod
+    def _avg_period_days(sums: Dict[str, np.ndarray]) -> float:
+        """Average period days over Current and Delinquent accounts."""
+        count = sums['period_days_count'][:2].sum()
+        avg_period_days = sums['period_days'][:2].sum() / count if count > 0 else 0
+        if avg_period_days == 0:
+            avg_period_days = 30  # Default to 30 days if calculation fails
+        return avg_period_days
     
     def calculate_gross_portfolio_yield(self, filter_active: bool = True) -> Dict:
         """
@@ -238,53 +291,39 @@ class YieldMetricsCalculator:
         Formula: (Revenue from Current+Delinquent / Balance from Current+Delinquent+Default) × (365/period_days)
         
         Args:
-            filter_active: Whether to filter for active accounts only
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which these formulas never read
             
         Returns:
             Dictionary with GPY metrics
         """
-        df = self._get_filtered_data(filter_active)
-        
-        # Calculate period days for proper annualization
-        df['period_days'] = (df['snapshotEndingAt'] - df['snapshotBeginningAt']).dt.days
-        df['period_days'] = df['period_days'].clip(lower=1)  # Ensure no division by zero
+        sums = self._compute_sums()
+        balance = sums['accountDailyAveragePrincipalBalance']
+        revenue = sums['lineFeesAccrued'] + sums['cardNetInterchangeAccrued']
         
         # Denominator: balances including Current, Delinquent, Default
-        denom_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent', 'Default'])
-        total_balance = df.loc[denom_mask, 'accountDailyAveragePrincipalBalance'].sum()
+        total_balance = balance[:3].sum()
         
         # Numerator: revenue only from Current and Delinquent
-        num_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent'])
-        total_revenue = (df.loc[num_mask, 'lineFeesAccrued'].sum() + 
-                        df.loc[num_mask, 'cardNetInterchangeAccrued'].sum())
+        total_revenue = revenue[:2].sum()
         
         # Calculate average period days for annualization
-        avg_period_days = df.loc[num_mask, 'period_days'].mean()
-        if pd.isna(avg_period_days) or avg_period_days == 0:
-            avg_period_days = 30  # Default to 30 days if calculation fails
+        avg_period_days = self._avg_period_days(sums)
         
         # Calculate GPY with proper annualization
         gross_portfolio_yield = (total_revenue / total_balance) * (365 / avg_period_days) if total_balance > 0 else 0
         
-        # Calculate component breakdowns
-        current_revenue = df.loc[df['accountEndingStatus'] == 'Current', ['lineFeesAccrued', 'cardNetInterchangeAccrued']].sum().sum()
-        delinquent_revenue = df.loc[df['accountEndingStatus'] == 'Delinquent', ['lineFeesAccrued', 'cardNetInterchangeAccrued']].sum().sum()
-        
-        current_balance = df.loc[df['accountEndingStatus'] == 'Current', 'accountDailyAveragePrincipalBalance'].sum()
-        delinquent_balance = df.loc[df['accountEndingStatus'] == 'Delinquent', 'accountDailyAveragePrincipalBalance'].sum()
-        default_balance = df.loc[df['accountEndingStatus'] == 'Default', 'accountDailyAveragePrincipalBalance'].sum()
-        
         return {
             'gross_portfolio_yield': gross_portfolio_yield,
             'total_revenue': total_revenue,
             'total_balance': total_balance,
-            'current_revenue': current_revenue,
-            'delinquent_revenue': delinquent_revenue,
-            'current_balance': current_balance,
-            'delinquent_balance': delinquent_balance,
-            'default_balance': default_balance,
-            'accounts_included_revenue': len(df[num_mask]),
-            'accounts_included_balance': len(df[denom_mask]),
+            'current_revenue': revenue[0],
+            'delinquent_revenue': revenue[1],
+            'current_balance': balance[0],
+            'delinquent_balance': balance[1],
+            'default_balance': balance[2],
+            'accounts_included_revenue': int(sums['accounts'][:2].sum()),
+            'accounts_included_balance': int(sums['accounts'][:3].sum()),
             'avg_period_days': avg_period_days,
             'annualization_factor': 365 / avg_period_days
         }
@@ -296,33 +335,25 @@ class YieldMetricsCalculator:
         Formula: ((Revenue from Current+Delinquent - Costs) / Balance from Current+Delinquent+Default) × (365/period_days)
         
         Args:
-            filter_active: Whether to filter for active accounts only
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which these formulas never read
             
         Returns:
             Dictionary with NPY metrics
         """
-        df = self._get_filtered_data(filter_active)
-        
-        # Calculate period days for proper annualization
-        df['period_days'] = (df['snapshotEndingAt'] - df['snapshotBeginningAt']).dt.days
-        df['period_days'] = df['period_days'].clip(lower=1)  # Ensure no division by zero
+        sums = self._compute_sums()
         
         # Denominator: balances including Current, Delinquent, Default
-        denom_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent', 'Default'])
-        total_balance = df.loc[denom_mask, 'accountDailyAveragePrincipalBalance'].sum()
+        total_balance = sums['accountDailyAveragePrincipalBalance'][:3].sum()
         
         # Numerator: revenue only from Current and Delinquent, minus costs
-        num_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent'])
-        total_revenue = (df.loc[num_mask, 'lineFeesAccrued'].sum() + 
-                        df.loc[num_mask, 'cardNetInterchangeAccrued'].sum())
+        total_revenue = sums['lineFeesAccrued'][:2].sum() + sums['cardNetInterchangeAccrued'][:2].sum()
         
         # Costs: card rewards from Current and Delinquent accounts
-        total_costs = df.loc[num_mask, 'cardRewardsAccrued'].sum()
+        total_costs = sums['cardRewardsAccrued'][:2].sum()
         
         # Calculate average period days for annualization
-        avg_period_days = df.loc[num_mask, 'period_days'].mean()
-        if pd.isna(avg_period_days) or avg_period_days == 0:
-            avg_period_days = 30  # Default to 30 days if calculation fails
+        avg_period_days = self._avg_period_days(sums)
         
         # Calculate NPY with proper annualization
         net_revenue = total_revenue - total_costs
@@ -346,7 +377,8 @@ class YieldMetricsCalculator:
         Formula: Net Portfolio Yield - (SOFR + 5%) = NPY - 10%
         
         Args:
-            filter_active: Whether to filter for active accounts only
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which these formulas never read
             
         Returns:
             Dictionary with NPY After Cost of Capital metrics
@@ -378,25 +410,24 @@ class YieldMetricsCalculator:
         Calculate Line Gross Portfolio Yield using industry-standard approach.
         
         Formula: (Line Revenue from Current+Delinquent / Line Balance from Current+Delinquent+Default) × (365/period_days)
-        """
-        df = self._get_filtered_data(filter_active)
         
-        # Calculate period days for proper annualization
-        df['period_days'] = (df['snapshotEndingAt'] - df['snapshotBeginningAt']).dt.days
-        df['period_days'] = df['period_days'].clip(lower=1)  # Ensure no division by zero
+        Args:
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which these formulas never read
+            
+        Returns:
+            Dictionary with line GPY metrics
+        """
+        sums = self._compute_sums()
         
         # Denominator: line balances including Current, Delinquent, Default
-        denom_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent', 'Default'])
-        total_line_balance = df.loc[denom_mask, 'lineDailyAveragePrincipalBalance'].sum()
+        total_line_balance = sums['lineDailyAveragePrincipalBalance'][:3].sum()
         
         # Numerator: line revenue only from Current and Delinquent
-        num_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent'])
-        total_line_revenue = df.loc[num_mask, 'lineFeesAccrued'].sum()
+        total_line_revenue = sums['lineFeesAccrued'][:2].sum()
         
         # Calculate average period days for annualization
-        avg_period_days = df.loc[num_mask, 'period_days'].mean()
-        if pd.isna(avg_period_days) or avg_period_days == 0:
-            avg_period_days = 30  # Default to 30 days if calculation fails
+        avg_period_days = self._avg_period_days(sums)
         
         # Calculate line GPY with proper annualization
         line_gross_portfolio_yield = (total_line_revenue / total_line_balance) * (365 / avg_period_days) if total_line_balance > 0 else 0
@@ -405,8 +436,8 @@ class YieldMetricsCalculator:
             'line_gross_portfolio_yield': line_gross_portfolio_yield,
             'total_line_revenue': total_line_revenue,
             'total_line_balance': total_line_balance,
-            'accounts_with_line_revenue': len(df[num_mask & (df['lineFeesAccrued'] > 0)]),
-            'accounts_with_line_balance': len(df[denom_mask & (df['lineDailyAveragePrincipalBalance'] > 0)]),
+            'accounts_with_line_revenue': int(sums['line_revenue_accounts'][:2].sum()),
+            'accounts_with_line_balance': int(sums['line_balance_accounts'][:3].sum()),
             'avg_period_days': avg_period_days,
             'annualization_factor': 365 / avg_period_days
         }
@@ -416,25 +447,24 @@ class YieldMetricsCalculator:
         Calculate Card Gross Portfolio Yield using industry-standard approach.
         
         Formula: (Card Revenue from Current+Delinquent / Card Balance from Current+Delinquent+Default) × (365/period_days)
-        """
-        df = self._get_filtered_data(filter_active)
         
-        # Calculate period days for proper annualization
-        df['period_days'] = (df['snapshotEndingAt'] - df['snapshotBeginningAt']).dt.days
-        df['period_days'] = df['period_days'].clip(lower=1)  # Ensure no division by zero
+        Args:
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which these formulas never read
+            
+        Returns:
+            Dictionary with card GPY metrics
+        """
+        sums = self._compute_sums()
         
         # Denominator: card balances including Current, Delinquent, Default
-        denom_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent', 'Default'])
-        total_card_balance = df.loc[denom_mask, 'cardDailyAveragePrincipalBalance'].sum()
+        total_card_balance = sums['cardDailyAveragePrincipalBalance'][:3].sum()
         
         # Numerator: card revenue only from Current and Delinquent
-        num_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent'])
-        total_card_revenue = df.loc[num_mask, 'cardNetInterchangeAccrued'].sum()
+        total_card_revenue = sums['cardNetInterchangeAccrued'][:2].sum()
         
         # Calculate average period days for annualization
-        avg_period_days = df.loc[num_mask, 'period_days'].mean()
-        if pd.isna(avg_period_days) or avg_period_days == 0:
-            avg_period_days = 30  # Default to 30 days if calculation fails
+        avg_period_days = self._avg_period_days(sums)
         
         # Calculate card GPY with proper annualization
         card_gross_portfolio_yield = (total_card_revenue / total_card_balance) * (365 / avg_period_days) if total_card_balance > 0 else 0
@@ -443,8 +473,8 @@ class YieldMetricsCalculator:
             'card_gross_portfolio_yield': card_gross_portfolio_yield,
             'total_card_revenue': total_card_revenue,
             'total_card_balance': total_card_balance,
-            'accounts_with_card_revenue': len(df[num_mask & (df['cardNetInterchangeAccrued'] > 0)]),
-            'accounts_with_card_balance': len(df[denom_mask & (df['cardDailyAveragePrincipalBalance'] > 0)]),
+            'accounts_with_card_revenue': int(sums['card_revenue_accounts'][:2].sum()),
+            'accounts_with_card_balance': int(sums['card_balance_accounts'][:3].sum()),
             'avg_period_days': avg_period_days,
             'annualization_factor': 365 / avg_period_days
         }
@@ -454,26 +484,25 @@ class YieldMetricsCalculator:
         Calculate Card Net Portfolio Yield using industry-standard approach.
         
         Formula: ((Card Revenue from Current+Delinquent - Card Costs) / Card Balance from Current+Delinquent+Default) × (365/period_days)
-        """
-        df = self._get_filtered_data(filter_active)
         
-        # Calculate period days for proper annualization
-        df['period_days'] = (df['snapshotEndingAt'] - df['snapshotBeginningAt']).dt.days
-        df['period_days'] = df['period_days'].clip(lower=1)  # Ensure no division by zero
+        Args:
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which these formulas never read
+            
+        Returns:
+            Dictionary with card NPY metrics
+        """
+        sums = self._compute_sums()
         
         # Denominator: card balances including Current, Delinquent, Default
-        denom_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent', 'Default'])
-        total_card_balance = df.loc[denom_mask, 'cardDailyAveragePrincipalBalance'].sum()
+        total_card_balance = sums['cardDailyAveragePrincipalBalance'][:3].sum()
         
         # Numerator: card revenue and costs only from Current and Delinquent
-        num_mask = df['accountEndingStatus'].isin(['Current', 'Delinquent'])
-        total_card_revenue = df.loc[num_mask, 'cardNetInterchangeAccrued'].sum()
-        total_card_costs = df.loc[num_mask, 'cardRewardsAccrued'].sum()
+        total_card_revenue = sums['cardNetInterchangeAccrued'][:2].sum()
+        total_card_costs = sums['cardRewardsAccrued'][:2].sum()
         
         # Calculate average period days for annualization
-        avg_period_days = df.loc[num_mask, 'period_days'].mean()
-        if pd.isna(avg_period_days) or avg_period_days == 0:
-            avg_period_days = 30  # Default to 30 days if calculation fails
+        avg_period_days = self._avg_period_days(sums)
         
         # Calculate card NPY with proper annualization
         net_card_revenue = total_card_revenue - total_card_costs
@@ -494,6 +523,10 @@ class YieldMetricsCalculator:
         """
         Calculate all yield metrics using industry-standard approach.
         
+        Args:
+            filter_active: Deprecated and ignored; it only excluded ChargedOff
+                accounts, which these formulas never read
+            
         Returns:
             Dictionary with all yield metrics
         """
@@ -526,18 +559,19 @@ class BusinessMetricsCalculator:
     """Calculate business-level metrics by vintage."""
     
     @staticmethod
-    def calculate_business_metrics(data: pd.DataFrame) -> pd.DataFrame:
+    def calculate_business_metrics(data: pd.DataFrame, *, preprocessed: bool = False) -> pd.DataFrame:
         """
         Calculate business-level metrics grouped by business and monthly vintage.
         
         Args:
             data: Preprocessed loan tape data
+            preprocessed: Whether data already went through preprocess_loan_tape
             
         Returns:
             DataFrame with business metrics by business and vintage
         """
-        # Create a copy to avoid modifying original data
-        df = data.copy()
+        # Work on a copy so a shared preprocessed frame is never modified
+        df = data.copy() if preprocessed else preprocess_loan_tape(data)
         
         # Calculate vintage month (month when account was activated)
         df['vintage_month'] = df['accountActivatedAt'].dt.to_period('M')
@@ -545,29 +579,48 @@ class BusinessMetricsCalculator:
         # Calculate account age in months
         df['accountAge'] = ((df['snapshotEndingAt'] - df['accountActivatedAt']).dt.days / 30.44).round(1)
         
-        # Calculate revenue (interest + interchange)
-        df['revenue'] = df['lineFeesAccrued'] + df['cardNetInterchangeAccrued']
-        
         # Calculate APR (annualized rate)
         df['apr'] = (df['lineFeesAccrued'] / df['accountDailyAveragePrincipalBalance'] * 365 / 30.44 * 100).round(2)
         
-        # Get priority status
-        df['status'] = df['accountEndingStatus'].apply(BusinessMetricsCalculator._get_priority_status)
+        # Get priority status (statuses outside the priority order become 'Unknown')
+        status = df['accountEndingStatus']
+        df['status'] = status.where(status.isin(_STATUS_PRIORITY), 'Unknown')
         
         # Add limit column (using balance as proxy since limit not in data)
         df['limit'] = df['accountDailyAveragePrincipalBalance'] * 1.2  # Estimate limit as 120% of balance
         
         # Group by business and vintage month, then aggregate metrics
-        business_vintage_metrics = df.groupby(['businessGuid', 'vintage_month']).agg({
+        keys = ['businessGuid', 'vintage_month']
+        grouped = df.groupby(keys, observed=True, sort=False)
+        aggregated = grouped.agg({
             'limit': 'sum',
             'accountDailyAveragePrincipalBalance': 'sum',
             'accountAge': 'mean',
             'revenue': 'sum',
-            'apr': 'mean',
-            'status': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else 'Unknown',
-            'capitalAccountGuid': 'count',
-            'accountType': lambda x: ', '.join(x.unique())  # Show all account types
-        }).reset_index()
+            'apr': 'mean'
+        })
+        
+        # Most frequent status per group; ties go to the alphabetically first
+        # status, matching Series.mode()
+        status_counts = df.groupby(keys + ['status'], observed=True, sort=False).size().reset_index(name='n')
+        aggregated['status'] = (
+            status_counts.sort_values(['n', 'status'], ascending=[False, True], kind='stable')
+            .drop_duplicates(keys)
+            .set_index(keys)['status']
+        )
+        aggregated['capitalAccountGuid'] = grouped['capitalAccountGuid'].count()
+        
+        # Show all account types, in order of first appearance within the group
+        aggregated['accountType'] = (
+            df[keys + ['accountType']].drop_duplicates()
+            .groupby(keys, observed=True, sort=False)['accountType'].agg(', '.join)
+        )
+        business_vintage_metrics = aggregated.reset_index()
+        
+        # businessGuid is categorical only for grouping; report it with its original dtype
+        guid = business_vintage_metrics['businessGuid']
+        if isinstance(guid.dtype, pd.CategoricalDtype):
+            business_vintage_metrics['businessGuid'] = guid.astype(guid.cat.categories.dtype)
         
         # Rename columns for clarity
         business_vintage_metrics.columns = [
@@ -587,17 +640,7 @@ class BusinessMetricsCalculator:
         business_vintage_metrics['businessId'] = business_vintage_metrics['businessGuid'].str[:8] + '...'
         
         # Sort by business, status priority, vintage month (newest first)
-        # Status priority: "Closed" > "Current" > "Delinquent" > "Default" > "ChargedOff"
-        status_priority = {
-            'Closed': 1,
-            'Current': 2,
-            'Delinquent': 3,
-            'Default': 4,
-            'ChargedOff': 5
-        }
-        
-        # Add status priority for sorting
-        business_vintage_metrics['status_priority'] = business_vintage_metrics['primaryStatus'].map(status_priority)
+        business_vintage_metrics['status_priority'] = business_vintage_metrics['primaryStatus'].map(_STATUS_PRIORITY)
         
         business_vintage_metrics = business_vintage_metrics.sort_values(
             ['businessGuid', 'status_priority', 'vintage_month'], 
@@ -607,26 +650,4 @@ class BusinessMetricsCalculator:
         # Remove the temporary status_priority column
         business_vintage_metrics = business_vintage_metrics.drop('status_priority', axis=1)
         
-        return business_vintage_metrics
-    
-    @staticmethod
-    def _get_priority_status(status: str) -> str:
-        """
-        Get priority status based on specified order.
-        Priority: "Closed" > "Current" > "Delinquent" > "Default" > "ChargedOff"
-        
-        Args:
-            status: Account status
-            
-        Returns:
-            Priority status
-        """
-        priority_order = {
-            'Closed': 1,
-            'Current': 2,
-            'Delinquent': 3,
-            'Default': 4,
-            'ChargedOff': 5
-        }
-        
-        return status if status in priority_order else 'Unknown' 
\ No newline at end of file
+        return business_vintage_metrics 
\ No newline at end of file
@@ -13,6 +13,10 @@ from .orders_data_processor import OrdersDataProcessor
 class OrdersAnalyzer:
     """Main class for orders analysis (Part 2)."""
     
+    # Order count above which customers are aggregated with scatter reductions
+    # over category codes; smaller tables stay on a plain pandas groupby
+    SCATTER_AGG_MIN_ORDERS = 10_000
+    
     def __init__(self, orders_path: str, bank_transactions_path: str):
         """
         Initialize the orders analyzer.
@@ -25,32 +29,66 @@ class OrdersAnalyzer:
         self.bank_transactions_path = bank_transactions_path
         self._orders_data = None
         self._bank_transactions = None
+        self._marketing_categories = None
         self._cohort_analysis = None
+        self._customer_agg = None
+        self._revenue_totals = None
         self._global_ltv = None
         self._global_aov = None
         self._global_cac = None
+        self._analysis_cache = None
     
     @property
     def orders_data(self) -> pd.DataFrame:
         """Lazy load orders data."""
         if self._orders_data is None:
-            self._orders_data = OrdersDataProcessor.load_orders_data(self.orders_path)
+            # updated_at and cancelled_at are never read, so skip parsing them
+            orders_data = OrdersDataProcessor.load_orders_data(
+                self.orders_path,
+                usecols=('order_id', 'created_at', 'customer', 'line_items', 'refunds', 'discounts')
+            )
+            # Convert order dates to monthly periods once for all monthly rollups
+            orders_data['created_month'] = orders_data['created_at'].dt.to_period('M')
+            self._orders_data = orders_data
         return self._orders_data
     
     @property
     def bank_transactions(self) -> pd.DataFrame:
         """Lazy load bank transactions data."""
         if self._bank_transactions is None:
-            self._bank_transactions = OrdersDataProcessor.load_bank_transactions(self.bank_transactions_path)
+            # CAC and the summary stats only read date, amount and category
+            bank_transactions = OrdersDataProcessor.load_bank_transactions(
+                self.bank_transactions_path, usecols=('date', 'amount', 'category')
+            )
+            # Precompute the marketing mask and transaction month used by CAC,
+            # matching 'Marketing' against the distinct categories only
+            categories = bank_transactions['category'].cat.categories
+            self._marketing_categories = categories[categories.str.contains('Marketing', regex=False)]
+            bank_transactions['is_marketing'] = bank_transactions['category'].isin(self._marketing_categories)
+            bank_transactions['month'] = bank_transactions['date'].dt.to_period('M')
+            self._bank_transactions = bank_transactions
         return self._bank_transactions
     
     def analyze_orders(self) -> Dict:
         """
         Run complete orders analysis (Part 2).
         
+        Results are reused while the loaded frames are unchanged. Each call
+        returns a new dictionary, but the metric values inside it are shared
+        between calls and should be treated as read-only.
+        
         Returns:
             Dictionary with all Part 2 metrics and insights
         """
+        # Reuse the previous results while the loaded data is unchanged
+        orders_data, bank_transactions = self.orders_data, self.bank_transactions
+        if self._analysis_cache is not None:
+            cached_orders, cached_bank_transactions, results = self._analysis_cache
+            if cached_orders is orders_data and cached_bank_transactions is bank_transactions:
+                return dict(results)
+            # The frames were replaced since the last run, so every derived result is stale
+            self._invalidate_caches()
+        
         # Calculate cohort metrics
         self._cohort_analysis = self._calculate_cohort_metrics()
         
@@ -65,7 +103,7 @@ class OrdersAnalyzer:
         # Get summary stats
         summary_stats = self.get_summary_stats()
         
-        return {
+        results = {
             'cohort_metrics': self._cohort_analysis,
             'lifetime_value': ltv_analysis,
             'average_order_value': aov_analysis,
@@ -73,6 +111,111 @@ class OrdersAnalyzer:
             'insights': insights,
             'summary_stats': summary_stats
         }
+        self._analysis_cache = (orders_data, bank_transactions, results)
+        
+        return dict(results)
+    
+    def _invalidate_caches(self) -> None:
+        """Drop every result derived from the loaded frames."""
+        self._cohort_analysis = None
+        self._customer_agg = None
+        self._revenue_totals = None
+        self._global_ltv = None
+        self._global_aov = None
+        self._global_cac = None
+        self._analysis_cache = None
+    
+    def _count_customers(self) -> int:
+        """Count distinct customers from the categorical customer column."""
+        return len(self.orders_data['customer'].cat.categories)
+    
+    def _calculate_revenue_totals(self) -> pd.Series:
+        """
+        Sum the order revenue columns in one reduction (cached).
+        
+        Returns:
+            Series of totals indexed by gross_amount, refunds, discounts and net_revenue
+        """
+        if self._revenue_totals is None:
+            self._revenue_totals = self.orders_data[
+                ['gross_amount', 'refunds', 'discounts', 'net_revenue']
+            ].sum()
+        
+        return self._revenue_totals
+    
+    @staticmethod
+    def _aggregate_by_code(codes: np.ndarray, dates: np.ndarray, has_order: np.ndarray,
+                           revenue: np.ndarray, n_codes: int) -> Tuple[np.ndarray, ...]:
+        """
+        Aggregate order arrays per integer customer code with scatter reductions.
+        
+        Args:
+            codes: Non-negative customer category codes, one per order
+            dates: Order timestamps (datetime64), one per order
+            has_order: Whether each order has a non-null order_id
+            revenue: Net revenue per order, with missing values as 0.0
+            n_codes: Number of customer categories
+            
+        Returns:
+            Tuple of per-code arrays: (row_count, first_order, last_order, order_count, total_spent)
+        """
+        row_count = np.bincount(codes, minlength=n_codes)
+        
+        # fmin/fmax skip NaT the same way groupby min/max do
+        first_order = np.full(n_codes, np.datetime64('NaT'), dtype=dates.dtype)
+        np.fmin.at(first_order, codes, dates)
+        last_order = np.full(n_codes, np.datetime64('NaT'), dtype=dates.dtype)
+        np.fmax.at(last_order, codes, dates)
+        
+        order_count = np.bincount(codes, weights=has_order, minlength=n_codes).astype(np.int64)
+        total_spent = np.bincount(codes, weights=revenue, minlength=n_codes)
+        
+        return row_count, first_order, last_order, order_count, total_spent
+    
+    def _calculate_customer_agg(self) -> pd.DataFrame:
+        """
+        Aggregate orders per customer (cached).
+        
+        Large tables are reduced in a single pass over category codes; below
+        SCATTER_AGG_MIN_ORDERS the pandas groupby is cheaper to set up.
+        
+        Returns:
+            DataFrame with one row per customer: first_order, last_order,
+            order_count and total_spent (net revenue)
+        """
+        if self._customer_agg is None:
+            if len(self.orders_data) < self.SCATTER_AGG_MIN_ORDERS:
+                self._customer_agg = self.orders_data.groupby('customer', observed=True).agg(
+                    first_order=('created_at', 'min'),
+                    last_order=('created_at', 'max'),
+                    order_count=('order_id', 'count'),
+                    total_spent=('net_revenue', 'sum')
+                ).reset_index()
+                return self._customer_agg
+            
+            customer = self.orders_data['customer']
+            codes = customer.cat.codes.to_numpy()
+            
+            # Orders without a customer are not grouped
+            valid = codes >= 0
+            row_count, first_order, last_order, order_count, total_spent = self._aggregate_by_code(
+                codes[valid].astype(np.intp),
+                self.orders_data['created_at'].to_numpy()[valid],
+                self.orders_data['order_id'].notna().to_numpy()[valid],
+                self.orders_data['net_revenue'].to_numpy(dtype=np.float64, na_value=0.0)[valid],
+                len(customer.cat.categories)
+            )
+            
+            observed = row_count > 0
+            self._customer_agg = pd.DataFrame({
+                'customer': pd.Categorical.from_codes(np.flatnonzero(observed), dtype=customer.dtype),
+                'first_order': first_order[observed],
+                'last_order': last_order[observed],
+                'order_count': order_count[observed],
+                'total_spent': total_spent[observed]
+            })
+        
+        return self._customer_agg
     
     def _calculate_cohort_metrics(self) -> pd.DataFrame:
         """
@@ -81,26 +224,16 @@ class OrdersAnalyzer:
         Returns:
             DataFrame with cohort metrics
         """
-        # Extract customer and first order date
-        customer_cohorts = self.orders_data.groupby('customer').agg({
-            'created_at': 'min',
-            'order_id': 'count',
-            'net_revenue': 'sum'  # Use net_revenue instead of total_amount
-        }).reset_index()
-        
-        customer_cohorts.columns = ['customer', 'first_order_date', 'order_count', 'total_spent']
-        
-        # Add cohort month
-        customer_cohorts['cohort_month'] = customer_cohorts['first_order_date'].dt.to_period('M')
+        # Assign each customer to the month of their first order
+        customer_agg = self._calculate_customer_agg()
+        cohort_month = customer_agg['first_order'].dt.to_period('M').rename('cohort_month')
         
         # Calculate cohort metrics
-        cohort_metrics = customer_cohorts.groupby('cohort_month').agg({
-            'customer': 'count',
-            'order_count': 'sum',
-            'total_spent': 'sum'
-        }).reset_index()
-        
-        cohort_metrics.columns = ['cohort_month', 'customer_count', 'total_orders', 'total_revenue']
+        cohort_metrics = customer_agg.groupby(cohort_month, observed=True).agg(
+            customer_count=('customer', 'count'),
+            total_orders=('order_count', 'sum'),
+            total_revenue=('total_spent', 'sum')
+        ).reset_index()
         cohort_metrics['average_orders_per_customer'] = cohort_metrics['total_orders'] / cohort_metrics['customer_count']
         cohort_metrics['average_revenue_per_customer'] = cohort_metrics['total_revenue'] / cohort_metrics['customer_count']
         
@@ -114,6 +247,24 @@ class OrdersAnalyzer:
         
         return cohort_metrics
     
+    @staticmethod
+    def _cohort_records(df: pd.DataFrame, columns: List[str]) -> List[Dict]:
+        """
+        Build per-cohort record dicts column-wise.
+        
+        Callers (the report template, chart builders and the cached analysis
+        results) iterate the records more than once, so they stay a list.
+        
+        Args:
+            df: Cohort-level DataFrame
+            columns: Columns to include in each record
+            
+        Returns:
+            List of dictionaries, one per cohort
+        """
+        values = [df[col].tolist() for col in columns]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+    
     def _calculate_global_ltv(self) -> Dict:
         """
         Calculate global lifetime value metrics from clean orders data (cached).
@@ -123,12 +274,12 @@ class OrdersAnalyzer:
         """
         if self._global_ltv is None:
             # Calculate global metrics directly from orders data
-            total_revenue = self.orders_data['net_revenue'].sum()
-            total_customers = self.orders_data['customer'].nunique()
+            total_revenue = self._calculate_revenue_totals()['net_revenue']
+            total_customers = self._count_customers()
             global_ltv = total_revenue / total_customers if total_customers > 0 else 0
             
             # Calculate customer-level LTV for median
-            customer_ltv = self.orders_data.groupby('customer')['net_revenue'].sum()
+            customer_ltv = self._calculate_customer_agg()['total_spent']
             
             self._global_ltv = {
                 'average_ltv': global_ltv,
@@ -149,11 +300,11 @@ class OrdersAnalyzer:
         if self._cohort_analysis is None:
             self._cohort_analysis = self._calculate_cohort_metrics()
         
-        ltv_data = self._cohort_analysis.copy()
-        ltv_data['ltv'] = ltv_data['average_revenue_per_customer']
+        # avg_ltv is already the per-cohort LTV; renaming shares the column data
+        ltv_data = self._cohort_analysis.rename(columns={'avg_ltv': 'ltv'})
         
         return {
-            'by_cohort': ltv_data[['cohort_month', 'customer_count', 'ltv']].to_dict('records'),
+            'by_cohort': self._cohort_records(ltv_data, ['cohort_month', 'customer_count', 'ltv']),
             'summary': self._calculate_global_ltv()
         }
     
@@ -166,7 +317,7 @@ class OrdersAnalyzer:
         """
         if self._global_aov is None:
             # Calculate global metrics directly from orders data
-            total_revenue = self.orders_data['net_revenue'].sum()
+            total_revenue = self._calculate_revenue_totals()['net_revenue']
             total_orders = len(self.orders_data)
             global_aov = total_revenue / total_orders if total_orders > 0 else 0
             
@@ -189,11 +340,10 @@ class OrdersAnalyzer:
         if self._cohort_analysis is None:
             self._cohort_analysis = self._calculate_cohort_metrics()
         
-        aov_data = self._cohort_analysis.copy()
-        aov_data['aov'] = aov_data['total_revenue'] / aov_data['total_orders']
+        aov_data = self._cohort_analysis.rename(columns={'avg_aov': 'aov'})
         
         return {
-            'by_cohort': aov_data[['cohort_month', 'customer_count', 'aov']].to_dict('records'),
+            'by_cohort': self._cohort_records(aov_data, ['cohort_month', 'customer_count', 'aov']),
             'summary': self._calculate_global_aov()
         }
     
@@ -206,11 +356,13 @@ class OrdersAnalyzer:
         """
         if self._global_cac is None:
             # Estimate CAC based on bank transactions (marketing spend)
-            marketing_spend = self.bank_transactions[
-                self.bank_transactions['category'].str.contains('Marketing', na=False)
-            ]['amount'].sum()
+            bank_transactions = self.bank_transactions
+            if len(self._marketing_categories) == 0:
+                marketing_spend = 0.0
+            else:
+                marketing_spend = bank_transactions.loc[bank_transactions['is_marketing'], 'amount'].sum()
             
-            total_customers = self.orders_data['customer'].nunique()
+            total_customers = self._count_customers()
             estimated_cac = abs(marketing_spend) / total_customers if total_customers > 0 else 0
             
             # Calculate LTV/CAC ratio using global LTV
@@ -236,28 +388,21 @@ class OrdersAnalyzer:
         if self._cohort_analysis is None:
             self._cohort_analysis = self._calculate_cohort_metrics()
         
-        # Calculate marketing spend by month
-        bank_transactions = self.bank_transactions.copy()
-        bank_transactions['month'] = pd.to_datetime(bank_transactions['date']).dt.to_period('M')
-        
-        # Filter for marketing transactions
-        marketing_transactions = bank_transactions[
-            bank_transactions['category'].str.contains('Marketing', na=False)
-        ]
+        # Filter for marketing transactions, keeping only the columns needed
+        bank_transactions = self.bank_transactions
+        marketing_transactions = bank_transactions.loc[bank_transactions['is_marketing'], ['month', 'amount']]
         
         # Calculate marketing spend by month
-        monthly_marketing_spend = marketing_transactions.groupby('month')['amount'].sum().abs()
-        
-        # Get cohort data
-        cac_data = self._cohort_analysis.copy()
+        monthly_marketing_spend = marketing_transactions.groupby('month', observed=True, sort=False)['amount'].sum().abs()
         
         # Calculate CAC for each cohort
-        cac_data['marketing_spend'] = cac_data['cohort_month'].map(monthly_marketing_spend).fillna(0)
-        cac_data['cac'] = cac_data['marketing_spend'] / cac_data['customer_count']
-        cac_data['cac'] = cac_data['cac'].fillna(0)  # Handle division by zero
+        cohort_data = self._cohort_analysis
+        marketing_spend = cohort_data['cohort_month'].map(monthly_marketing_spend).fillna(0)
+        cac = (marketing_spend / cohort_data['customer_count']).fillna(0)  # Handle division by zero
+        cac_data = cohort_data.assign(marketing_spend=marketing_spend, cac=cac)
         
         return {
-            'by_cohort': cac_data[['cohort_month', 'customer_count', 'marketing_spend', 'cac']].to_dict('records'),
+            'by_cohort': self._cohort_records(cac_data, ['cohort_month', 'customer_count', 'marketing_spend', 'cac']),
             'summary': self._calculate_global_cac()
         }
     
@@ -271,48 +416,45 @@ class OrdersAnalyzer:
         insights = {}
         
         # Customer behavior insights
-        customer_behavior = self.orders_data.groupby('customer').agg({
-            'order_id': 'count',
-            'net_revenue': 'sum',  # Use net_revenue instead of total_amount
-            'created_at': ['min', 'max']
-        }).reset_index()
+        customer_behavior = self._calculate_customer_agg()
+        customer_lifetime_days = (customer_behavior['last_order'] - customer_behavior['first_order']).dt.days
         
-        customer_behavior.columns = ['customer', 'order_count', 'total_spent', 'first_order', 'last_order']
-        customer_behavior['customer_lifetime_days'] = (
-            customer_behavior['last_order'] - customer_behavior['first_order']
-        ).dt.days
+        order_counts = customer_behavior['order_count'].to_numpy()
+        total_customers = order_counts.size
+        repeat_customers = int((order_counts > 1).sum())
         
         insights['customer_behavior'] = {
-            'total_customers': len(customer_behavior),
+            'total_customers': total_customers,
             'average_orders_per_customer': customer_behavior['order_count'].mean(),
-            'average_customer_lifetime_days': customer_behavior['customer_lifetime_days'].mean(),
-            'repeat_customers': len(customer_behavior[customer_behavior['order_count'] > 1]),
-            'repeat_customer_rate': len(customer_behavior[customer_behavior['order_count'] > 1]) / len(customer_behavior)
+            'average_customer_lifetime_days': customer_lifetime_days.mean(),
+            'repeat_customers': repeat_customers,
+            'repeat_customer_rate': repeat_customers / total_customers if total_customers > 0 else 0
         }
         
         # Revenue insights (using net revenue)
         revenue_analysis = self.orders_data.groupby(
-            self.orders_data['created_at'].dt.to_period('M')
-        ).agg({
-            'order_id': 'count',
-            'net_revenue': 'sum'  # Use net_revenue instead of total_amount
-        }).reset_index()
+            self.orders_data['created_month'].rename('month'), observed=True, as_index=False
+        ).agg(
+            order_count=('order_id', 'count'),
+            revenue=('net_revenue', 'sum')  # Use net_revenue instead of total_amount
+        )
         
-        revenue_analysis.columns = ['month', 'order_count', 'revenue']
+        monthly_revenue = revenue_analysis['revenue'].to_numpy()
         
         insights['revenue_trends'] = {
             'total_revenue': revenue_analysis['revenue'].sum(),
             'average_monthly_revenue': revenue_analysis['revenue'].mean(),
             'revenue_growth_trend': 'increasing' if len(revenue_analysis) > 1 and 
                 revenue_analysis['revenue'].iloc[-1] > revenue_analysis['revenue'].iloc[0] else 'stable',
-            'peak_month': revenue_analysis.loc[revenue_analysis['revenue'].idxmax(), 'month'] if not revenue_analysis.empty else None
+            'peak_month': revenue_analysis['month'].iloc[int(np.argmax(monthly_revenue))] if monthly_revenue.size else None
         }
         
         # Add refund and discount insights
-        total_gross = self.orders_data['gross_amount'].sum()
-        total_refunds = self.orders_data['refunds'].sum()
-        total_discounts = self.orders_data['discounts'].sum()
-        total_net = self.orders_data['net_revenue'].sum()
+        revenue_totals = self._calculate_revenue_totals()
+        total_gross = revenue_totals['gross_amount']
+        total_refunds = revenue_totals['refunds']
+        total_discounts = revenue_totals['discounts']
+        total_net = revenue_totals['net_revenue']
         
         insights['revenue_breakdown'] = {
             'gross_revenue': total_gross,
@@ -324,16 +466,14 @@ class OrdersAnalyzer:
         }
         
         # Geographic insights
-        if 'location' in self.orders_data.columns:
-            # Handle location data that's already parsed as dict
-            countries = []
-            for location in self.orders_data['location']:
-                if isinstance(location, dict) and 'country' in location:
-                    countries.append(location.get('country', 'Unknown'))
-                else:
-                    countries.append('Unknown')
-            
-            insights['geographic_distribution'] = pd.Series(countries).value_counts().to_dict()
+        if 'country' in self.orders_data.columns:
+            country = self.orders_data['country']
+            categories = country.cat.categories
+            codes = country.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+            # Most common first, as value_counts would order them
+            order = np.argsort(-counts, kind='stable')
+            insights['geographic_distribution'] = dict(zip(categories[order], counts[order].tolist()))
         
         return insights
     
@@ -344,27 +484,31 @@ class OrdersAnalyzer:
         Returns:
             Dictionary with summary statistics
         """
+        customer_agg = self._calculate_customer_agg()
+        revenue_totals = self._calculate_revenue_totals()
+        
         # Calculate average LTV
-        customer_ltv = self.orders_data.groupby('customer')['net_revenue'].sum()
+        customer_ltv = customer_agg['total_spent']
         average_ltv = customer_ltv.mean() if len(customer_ltv) > 0 else 0
         
         # Calculate average AOV
         average_aov = self.orders_data['net_revenue'].mean()
         
         # Calculate average orders per customer
-        customer_orders = self.orders_data.groupby('customer')['order_id'].count()
-        avg_orders_per_customer = customer_orders.mean()
+        avg_orders_per_customer = customer_agg['order_count'].mean()
         
         # Get CAC metrics
         cac_metrics = self._calculate_global_cac()
         
         # Get cohort metrics for number of cohorts
-        cohort_metrics = self._calculate_cohort_metrics()
+        if self._cohort_analysis is None:
+            self._cohort_analysis = self._calculate_cohort_metrics()
+        cohort_metrics = self._cohort_analysis
         number_of_cohorts = len(cohort_metrics) if not cohort_metrics.empty else 0
         
         return {
             'total_orders': len(self.orders_data),
-            'total_customers': self.orders_data['customer'].nunique(),
+            'total_customers': self._count_customers(),
             'average_ltv': average_ltv,
             'average_aov': average_aov,
             'avg_orders_per_customer': avg_orders_per_customer,
@@ -372,14 +516,14 @@ class OrdersAnalyzer:
                 'start': self.orders_data['created_at'].min(),
                 'end': self.orders_data['created_at'].max()
             },
-            'gross_revenue': self.orders_data['gross_amount'].sum(),
-            'net_revenue': self.orders_data['net_revenue'].sum(),
-            'total_revenue': self.orders_data['net_revenue'].sum(),  # Add total_revenue for template compatibility
-            'total_refunds': self.orders_data['refunds'].sum(),
-            'total_discounts': self.orders_data['discounts'].sum(),
-            'average_order_value': self.orders_data['net_revenue'].mean(),
+            'gross_revenue': revenue_totals['gross_amount'],
+            'net_revenue': revenue_totals['net_revenue'],
+            'total_revenue': revenue_totals['net_revenue'],  # Add total_revenue for template compatibility
+            'total_refunds': revenue_totals['refunds'],
+            'total_discounts': revenue_totals['discounts'],
+            'average_order_value': average_aov,
             'bank_transactions_count': len(self.bank_transactions),
-            'bank_transactions_categories': self.bank_transactions['category'].nunique(),
+            'bank_transactions_categories': len(self.bank_transactions['category'].cat.categories),
             # CAC metrics
             'average_cac': cac_metrics['estimated_cac'],
             'total_marketing_spend': cac_metrics['total_marketing_spend'],
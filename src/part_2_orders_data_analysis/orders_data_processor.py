@@ -3,27 +3,49 @@ Data processor for Part 2 orders and bank transactions data.
 """
 
 import pandas as pd
+import numpy as np
 import json
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
 
+from ..utils.load_cache import file_signature, get_cached_frame, load_cache_key, store_cached_frame
+
+# Bound decoder for the per-value parsers; skips json.loads' argument handling
+_decode_json = json.JSONDecoder().decode
+
+# Amount fields in priority order for refunds and discounts payloads
+_REFUND_AMOUNT_KEYS = ('shop_amount', 'presentment_amount', 'amount')
+_DISCOUNT_AMOUNT_KEYS = ('amount', 'shop_amount', 'presentment_amount')
 
 class OrdersDataProcessor:
     """Process orders and bank transactions data for Part 2 analysis."""
     
     @staticmethod
-    def load_orders_data(file_path: str) -> pd.DataFrame:
+    def load_orders_data(file_path: str, usecols: Optional[Sequence[str]] = None,
+                         *, cache: bool = False) -> pd.DataFrame:
         """
         Load and preprocess orders data.
         
         Args:
             file_path: Path to the orders CSV file
+            usecols: Optional subset of columns to read; all columns by default.
+                line_items, refunds and discounts are needed for the revenue columns.
+            cache: Keep the result and reuse it for later loads of the same,
+                unchanged file; off by default since each entry holds a copy of the frame
             
         Returns:
             Preprocessed orders DataFrame
         """
-        # Load the data
-        df = pd.read_csv(file_path)
+        if cache:
+            cache_key = load_cache_key('orders', file_path, usecols)
+            signature = file_signature(file_path)
+            cached = get_cached_frame(cache_key, signature)
+            if cached is not None:
+                return cached
+        
+        # Load the data, parsing customer straight into a categorical so
+        # per-customer grouping and counting work on integer codes
+        df = pd.read_csv(file_path, usecols=usecols, dtype={'customer': 'category'})
         
         # Convert date columns with robust parsing
         date_columns = ['created_at', 'updated_at', 'cancelled_at']
@@ -31,34 +53,69 @@ class OrdersDataProcessor:
             if col in df.columns:
                 df[col] = OrdersDataProcessor._robust_parse_dates(df, col)
         
+        # Decode each distinct line_items JSON string once, taking both the
+        # total amount and the location from the same parse
+        line_item_codes, line_item_values = pd.factorize(df['line_items'])
+        parsed_line_items = [OrdersDataProcessor._parse_line_items(value) for value in line_item_values]
+        # Missing line_items have code -1, which picks the trailing default
+        parsed_line_items.append((0.0, {}))
+        
         # Extract total amount from line_items JSON
-        df['gross_amount'] = df['line_items'].apply(OrdersDataProcessor._extract_total_amount)
+        gross_amounts = np.array([total for total, _ in parsed_line_items], dtype=np.float64)
+        df['gross_amount'] = gross_amounts[line_item_codes]
         
         # Parse refunds and discounts with correct field names
-        df['refunds'] = df['refunds'].apply(OrdersDataProcessor._parse_refunds)
-        df['discounts'] = df['discounts'].apply(OrdersDataProcessor._parse_discounts)
+        df['refunds'] = OrdersDataProcessor._parse_distinct_amounts(df['refunds'], OrdersDataProcessor._parse_refunds)
+        df['discounts'] = OrdersDataProcessor._parse_distinct_amounts(df['discounts'], OrdersDataProcessor._parse_discounts)
         
-        # Calculate net revenue (gross - refunds - discounts)
-        df['net_revenue'] = df['gross_amount'] - df['refunds'] - df['discounts']
+        # Calculate net revenue (gross - refunds - discounts), subtracting in
+        # place so only one result array is allocated
+        net_revenue = np.subtract(df['gross_amount'].to_numpy(), df['refunds'].to_numpy())
+        np.subtract(net_revenue, df['discounts'].to_numpy(), out=net_revenue)
+        # Money columns stay float64: shop amounts carry sub-cent fractions that float32 or cents would lose
+        df['net_revenue'] = net_revenue
         
         # Extract location data
-        df['location'] = df['line_items'].apply(OrdersDataProcessor._extract_location)
+        locations = np.empty(len(parsed_line_items), dtype=object)
+        locations[:] = [location for _, location in parsed_line_items]
+        df['location'] = locations[line_item_codes]
+        
+        # Precompute country once so insights can count it without a Python loop
+        countries = np.array(
+            [loc.get('country', 'Unknown') if isinstance(loc, dict) else 'Unknown' for loc in locations],
+            dtype=object
+        )
+        df['country'] = pd.Categorical(countries[line_item_codes])
+        
+        if cache:
+            store_cached_frame(cache_key, signature, df)
         
         return df
     
     @staticmethod
-    def load_bank_transactions(file_path: str) -> pd.DataFrame:
+    def load_bank_transactions(file_path: str, usecols: Optional[Sequence[str]] = None,
+                               *, cache: bool = False) -> pd.DataFrame:
         """
         Load and preprocess bank transactions data.
         
         Args:
             file_path: Path to the bank transactions CSV file
+            usecols: Optional subset of columns to read; all columns by default
+            cache: Keep the result and reuse it for later loads of the same,
+                unchanged file; off by default since each entry holds a copy of the frame
             
         Returns:
             Preprocessed bank transactions DataFrame
         """
-        # Load the data
-        df = pd.read_csv(file_path)
+        if cache:
+            cache_key = load_cache_key('bank_transactions', file_path, usecols)
+            signature = file_signature(file_path)
+            cached = get_cached_frame(cache_key, signature)
+            if cached is not None:
+                return cached
+        
+        # Load the data, parsing category straight into a categorical
+        df = pd.read_csv(file_path, usecols=usecols, dtype={'category': 'category'})
         
         # Convert date column
         df['date'] = pd.to_datetime(df['date'], errors='coerce')
@@ -66,8 +123,34 @@ class OrdersDataProcessor:
         # Convert amount to numeric
         df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
         
+        if cache:
+            store_cached_frame(cache_key, signature, df)
+        
         return df
     
+    @staticmethod
+    def _parse_line_items(line_items_str: str) -> Tuple[float, Dict[str, Any]]:
+        """
+        Decode a line_items JSON string once and extract total amount and location.
+        
+        Args:
+            line_items_str: JSON string containing line items
+            
+        Returns:
+            Tuple of (total amount, location data)
+        """
+        try:
+            if pd.isna(line_items_str):
+                return 0.0, {}
+            line_items = _decode_json(line_items_str)
+        except (json.JSONDecodeError, ValueError, TypeError):
+            return 0.0, {}
+        
+        return (
+            OrdersDataProcessor._sum_shop_amounts(line_items),
+            OrdersDataProcessor._find_location(line_items)
+        )
+    
     @staticmethod
     def _extract_total_amount(line_items_str: str) -> float:
         """
@@ -83,7 +166,22 @@ class OrdersDataProcessor:
             if pd.isna(line_items_str):
                 return 0.0
             
-            line_items = json.loads(line_items_str)
+            return OrdersDataProcessor._sum_shop_amounts(_decode_json(line_items_str))
+        except (json.JSONDecodeError, ValueError, TypeError):
+            return 0.0
+    
+    @staticmethod
+    def _sum_shop_amounts(line_items: Any) -> float:
+        """
+        Sum price_set shop amounts over decoded line items.
+        
+        Args:
+            line_items: Decoded line_items JSON value
+            
+        Returns:
+            Total amount as float
+        """
+        try:
             total = 0.0
             
             for item in line_items:
@@ -93,9 +191,32 @@ class OrdersDataProcessor:
                         total += float(price_set['shop_amount'])
             
             return total
-        except (json.JSONDecodeError, ValueError, TypeError):
+        except (ValueError, TypeError):
             return 0.0
     
+    @staticmethod
+    def _parse_distinct_amounts(values: pd.Series, parser: Callable[[str], float]) -> np.ndarray:
+        """
+        Parse an amount column by running the parser once per distinct value.
+        
+        Refunds and discounts are mostly empty and repeat heavily, so parsing
+        the distinct strings and scattering the results back is much cheaper
+        than a per-row apply.
+        
+        Args:
+            values: Raw string column
+            parser: Function turning one raw value into an amount
+            
+        Returns:
+            Parsed amounts as a float64 array aligned with values
+        """
+        codes, uniques = pd.factorize(values)
+        amounts = np.empty(len(uniques) + 1, dtype=np.float64)
+        amounts[:-1] = [parser(value) for value in uniques]
+        # Missing values have code -1, which picks the trailing 0.0
+        amounts[-1] = 0.0
+        return amounts[codes]
+    
     @staticmethod
     def _parse_refunds(value: str) -> float:
         """
@@ -113,28 +234,23 @@ class OrdersDataProcessor:
             
             # Try to parse as JSON first
             try:
-                parsed = json.loads(value)
+                parsed = _decode_json(value)
                 if isinstance(parsed, (int, float)):
                     return float(parsed)
                 elif isinstance(parsed, dict):
                     # For refunds: prefer shop_amount or presentment_amount
-                    if 'shop_amount' in parsed:
-                        return float(parsed['shop_amount'])
-                    elif 'presentment_amount' in parsed:
-                        return float(parsed['presentment_amount'])
-                    elif 'amount' in parsed:
-                        return float(parsed['amount'])
+                    for key in _REFUND_AMOUNT_KEYS:
+                        if key in parsed:
+                            return float(parsed[key])
                 elif isinstance(parsed, list) and len(parsed) > 0:
                     # Handle list of refunds
                     total = 0.0
                     for item in parsed:
                         if isinstance(item, dict):
-                            if 'shop_amount' in item:
-                                total += float(item['shop_amount'])
-                            elif 'presentment_amount' in item:
-                                total += float(item['presentment_amount'])
-                            elif 'amount' in item:
-                                total += float(item['amount'])
+                            for key in _REFUND_AMOUNT_KEYS:
+                                if key in item:
+                                    total += float(item[key])
+                                    break
                     return total
                 else:
                     return 0.0
@@ -162,28 +278,23 @@ class OrdersDataProcessor:
             
             # Try to parse as JSON first
             try:
-                parsed = json.loads(value)
+                parsed = _decode_json(value)
                 if isinstance(parsed, (int, float)):
                     return float(parsed)
                 elif isinstance(parsed, dict):
                     # For discounts: prefer 'amount' field
-                    if 'amount' in parsed:
-                        return float(parsed['amount'])
-                    elif 'shop_amount' in parsed:
-                        return float(parsed['shop_amount'])
-                    elif 'presentment_amount' in parsed:
-                        return float(parsed['presentment_amount'])
+                    for key in _DISCOUNT_AMOUNT_KEYS:
+                        if key in parsed:
+                            return float(parsed[key])
                 elif isinstance(parsed, list) and len(parsed) > 0:
                     # Handle list of discounts
                     total = 0.0
                     for item in parsed:
                         if isinstance(item, dict):
-                            if 'amount' in item:
-                                total += float(item['amount'])
-                            elif 'shop_amount' in item:
-                                total += float(item['shop_amount'])
-                            elif 'presentment_amount' in item:
-                                total += float(item['presentment_amount'])
+                            for key in _DISCOUNT_AMOUNT_KEYS:
+                                if key in item:
+                                    total += float(item[key])
+                                    break
                     return total
                 else:
                     return 0.0
@@ -206,8 +317,19 @@ class OrdersDataProcessor:
         Returns:
             Parsed dates as pandas Series
         """
-        result = pd.Series(index=df.index, dtype='datetime64[ns]')
+        # Well-formed columns parse in one vectorized pass; the chunked
+        # fallback below only runs when some value trips the bulk parser
+        try:
+            parsed = pd.to_datetime(df[column], format='mixed', utc=True)
+            return parsed.dt.tz_localize(None).astype('datetime64[ns]')
+        except Exception:
+            pass
+        
+        # Fill a raw array chunk by chunk and wrap it once at the end
+        result = np.full(len(df), np.datetime64('NaT'), dtype='datetime64[ns]')
         chunk_size = 1000
+        # Order timestamps repeat, so each distinct fallback value is parsed once
+        parsed_values = {}
         
         for i in range(0, len(df), chunk_size):
             chunk = df.iloc[i:i+chunk_size]
@@ -217,33 +339,52 @@ class OrdersDataProcessor:
                 chunk_dates = pd.to_datetime(chunk[column], format='mixed', utc=True)
                 # Convert to timezone-naive datetime
                 chunk_dates = chunk_dates.dt.tz_localize(None)
-                result.iloc[i:i+len(chunk)] = chunk_dates
+                result[i:i+len(chunk)] = chunk_dates.to_numpy(dtype='datetime64[ns]')
             except Exception:
                 # Fallback to individual parsing for this chunk
-                for j, date_str in enumerate(chunk[column]):
-                    try:
-                        if pd.isna(date_str) or date_str == '':
-                            result.iloc[i+j] = pd.NaT
-                        else:
-                            # Try different formats
-                            for fmt in ['%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S']:
-                                try:
-                                    result.iloc[i+j] = pd.to_datetime(date_str, format=fmt)
-                                    break
-                                except:
-                                    continue
-                            else:
-                                # If no format worked, try flexible parsing
-                                try:
-                                    parsed_date = pd.to_datetime(date_str, utc=True)
-                                    # Convert to timezone-naive datetime
-                                    result.iloc[i+j] = parsed_date.tz_localize(None) if parsed_date.tz is not None else parsed_date
-                                except:
-                                    result.iloc[i+j] = pd.NaT
-                    except:
-                        result.iloc[i+j] = pd.NaT
-        
-        return result
+                chunk_values = []
+                for date_str in chunk[column]:
+                    if pd.isna(date_str):
+                        chunk_values.append(pd.NaT)
+                        continue
+                    if date_str not in parsed_values:
+                        parsed_values[date_str] = OrdersDataProcessor._parse_date_value(date_str)
+                    chunk_values.append(parsed_values[date_str])
+                result[i:i+len(chunk)] = pd.to_datetime(chunk_values).as_unit('ns')
+        
+        return pd.Series(result, index=df.index)
+    
+    @staticmethod
+    def _parse_date_value(date_str: str) -> pd.Timestamp:
+        """
+        Parse a single date string, trying known formats before flexible parsing.
+        
+        Args:
+            date_str: Date string to parse
+            
+        Returns:
+            Timezone-naive Timestamp, or NaT if the value cannot be parsed
+        """
+        try:
+            if pd.isna(date_str) or date_str == '':
+                return pd.NaT
+            
+            # Try different formats
+            for fmt in ['%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S']:
+                try:
+                    return pd.to_datetime(date_str, format=fmt)
+                except:
+                    continue
+            
+            # If no format worked, try flexible parsing
+            try:
+                parsed_date = pd.to_datetime(date_str, utc=True)
+                # Convert to timezone-naive datetime
+                return parsed_date.tz_localize(None) if parsed_date.tz is not None else parsed_date
+            except:
+                return pd.NaT
+        except:
+            return pd.NaT
 
     @staticmethod
     def _extract_location(line_items_str: str) -> Dict[str, Any]:
@@ -262,21 +403,32 @@ class OrdersDataProcessor:
             
             # Try to extract location from the JSON structure
             # The location data seems to be embedded in the line_items structure
-            data = json.loads(line_items_str)
-            
-            # Look for location data in the structure
-            if isinstance(data, dict) and 'location' in data:
-                return data['location']
-            elif isinstance(data, list) and len(data) > 0:
-                # Check if first item has location info
-                first_item = data[0]
-                if isinstance(first_item, dict) and 'location' in first_item:
-                    return first_item['location']
-            
-            return {}
+            return OrdersDataProcessor._find_location(_decode_json(line_items_str))
         except (json.JSONDecodeError, ValueError, TypeError):
             return {}
     
+    @staticmethod
+    def _find_location(data: Any) -> Dict[str, Any]:
+        """
+        Find location data in decoded line items.
+        
+        Args:
+            data: Decoded line_items JSON value
+            
+        Returns:
+            Dictionary with location data
+        """
+        # Look for location data in the structure
+        if isinstance(data, dict) and 'location' in data:
+            return data['location']
+        elif isinstance(data, list) and len(data) > 0:
+            # Check if first item has location info
+            first_item = data[0]
+            if isinstance(first_item, dict) and 'location' in first_item:
+                return first_item['location']
+        
+        return {}
+    
     @staticmethod
     def parse_json_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
         """
@@ -292,5 +444,8 @@ class OrdersDataProcessor:
         if column not in df.columns:
             return df
         
-        df[column] = df[column].apply(lambda x: json.loads(x) if pd.notna(x) and x != '' else {})
+        df[column] = [
+            _decode_json(x) if pd.notna(x) and x != '' else {}
+            for x in df[column].to_numpy()
+        ]
         return df 
\ No newline at end of file
@@ -23,8 +23,11 @@ class HTMLReportGenerator:
         self.template_dir = Path(__file__).parent / "templates"
         self.env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(str(self.template_dir)),
-            autoescape=True
+            autoescape=True,
+            # Templates ship with the package, so skip the per-lookup mtime check
+            auto_reload=False
         )
+        self._combined_template = None
     
     def generate_combined_report(self, data: Dict[str, Any], output_path: str) -> None:
         """
@@ -50,17 +53,7 @@ class HTMLReportGenerator:
         # Calculate account type distribution
         account_type_distribution = {}
         if not part1_data.get('business_metrics', pd.DataFrame()).empty:
-            business_metrics = part1_data['business_metrics']
-            # Split account types and count occurrences
-            all_account_types = []
-            for account_types_str in business_metrics['accountTypes'].dropna():
-                if isinstance(account_types_str, str):
-                    account_types = [at.strip() for at in account_types_str.split(',')]
-                    all_account_types.extend(account_types)
-            
-            # Count occurrences
-            if all_account_types:
-                account_type_distribution = pd.Series(all_account_types).value_counts().to_dict()
+            account_type_distribution = self._count_account_types(part1_data['business_metrics']).to_dict()
         
         # Prepare template data
         template_data = {
@@ -83,38 +76,29 @@ class HTMLReportGenerator:
             'account_type_distribution': account_type_distribution
         }
         
-        # Render template
-        template = self.env.get_template('combined_report_template.html.j2')
-        html_content = template.render(**template_data)
+        # Render template, compiling it on first use only
+        if self._combined_template is None:
+            self._combined_template = self.env.get_template('combined_report_template.html.j2')
+        html_content = self._combined_template.render(**template_data)
         
         # Save report
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
     
-    def _create_portfolio_metrics_chart(self, portfolio_metrics: List[Dict]) -> Dict:
-        """Create a bar chart showing portfolio metrics."""
+    def _create_portfolio_metrics_chart(self, portfolio_metrics: List[Dict]) -> str:
+        """Create a bar chart showing portfolio metrics, as Plotly figure JSON."""
         if not portfolio_metrics:
-            return {}
+            return ''
         
         # Since portfolio metrics don't have time series data, create a bar chart
-        df = pd.DataFrame(portfolio_metrics)
-        
-        # Get the latest metrics (first row)
-        if len(df) == 0:
-            return {}
-            
-        latest_metrics = df.iloc[0]
+        # from the latest metrics (first record)
+        latest_metrics = portfolio_metrics[0]
         
         # Create bar chart for key metrics
         metrics = ['delinquency_rate', 'default_rate', 'charge_off_rate']
         metric_names = ['Delinquency Rate', 'Default Rate', 'Charge-off Rate']
-        values = []
-        
-        for metric in metrics:
-            if metric in latest_metrics:
-                values.append(latest_metrics[metric] * 100)  # Convert to percentage
-            else:
-                values.append(0)
+        # Convert to percentage
+        values = [latest_metrics.get(metric, 0) * 100 for metric in metrics]
         
         fig = go.Figure(data=[
             go.Bar(
@@ -135,12 +119,12 @@ class HTMLReportGenerator:
             showlegend=False
         )
         
-        return fig.to_dict()
+        return fig.to_json()
     
-    def _create_yield_metrics_chart(self, yield_metrics: Dict) -> Dict:
-        """Create a bar chart comparing different yield metrics."""
+    def _create_yield_metrics_chart(self, yield_metrics: Dict) -> str:
+        """Create a bar chart comparing different yield metrics, as Plotly figure JSON."""
         if not yield_metrics:
-            return {}
+            return ''
         
         # Extract yield values
         metrics = []
@@ -154,7 +138,7 @@ class HTMLReportGenerator:
                 colors.append('#667eea')
         
         if not metrics:
-            return {}
+            return ''
         
         fig = go.Figure(data=[
             go.Bar(
@@ -175,17 +159,17 @@ class HTMLReportGenerator:
             showlegend=False
         )
         
-        return fig.to_dict()
+        return fig.to_json()
     
-    def _create_ltv_by_cohort_chart(self, cohort_analysis: Dict) -> Dict:
-        """Create a simple bar chart using Plotly Express."""
+    def _create_ltv_by_cohort_chart(self, cohort_analysis: Dict) -> str:
+        """Create a simple bar chart using Plotly Express, as Plotly figure JSON."""
         # Use cohort_metrics data instead of lifetime_value data
         if not cohort_analysis or 'cohort_metrics' not in cohort_analysis:
-            return {}
+            return ''
         
         cohort_metrics = cohort_analysis['cohort_metrics']
         if cohort_metrics.empty:
-            return {}
+            return ''
         
         # Sort by cohort date for proper ordering
         cohort_metrics = cohort_metrics.sort_values('cohort_month')
@@ -217,18 +201,22 @@ class HTMLReportGenerator:
         
         return json.dumps(fig, cls=PlotlyJSONEncoder)
     
-    def _create_aov_by_cohort_chart(self, cohort_analysis: Dict) -> Dict:
-        """Create a line chart showing AOV by cohort."""
+    def _create_aov_by_cohort_chart(self, cohort_analysis: Dict) -> str:
+        """Create a line chart showing AOV by cohort, as Plotly figure JSON."""
         if not cohort_analysis or 'by_cohort' not in cohort_analysis:
-            return {}
+            return ''
         
         aov_data = cohort_analysis['by_cohort']
         if not aov_data:
-            return {}
+            return ''
         
         # Convert to DataFrame for easier manipulation
         df = pd.DataFrame(aov_data)
-        df['cohort_date'] = pd.to_datetime(df['cohort_month'].astype(str))
+        if isinstance(df['cohort_month'].dtype, pd.PeriodDtype):
+            # Period cohorts convert to month-start timestamps without a string round trip
+            df['cohort_date'] = df['cohort_month'].dt.to_timestamp()
+        else:
+            df['cohort_date'] = pd.to_datetime(df['cohort_month'].astype(str))
         
         fig = go.Figure()
         
@@ -253,10 +241,10 @@ class HTMLReportGenerator:
         
         return json.dumps(fig, cls=PlotlyJSONEncoder)
     
-    def _create_revenue_gauge_chart(self, summary_stats: Dict) -> Dict:
-        """Create a gauge chart showing revenue metrics."""
+    def _create_revenue_gauge_chart(self, summary_stats: Dict) -> str:
+        """Create a gauge chart showing revenue metrics, as Plotly figure JSON."""
         if not summary_stats:
-            return {}
+            return ''
         
         # Calculate revenue efficiency
         gross_revenue = summary_stats.get('gross_revenue', 0)
@@ -294,8 +282,23 @@ class HTMLReportGenerator:
             template="plotly_white"
         )
         
-        return fig.to_dict() 
+        return fig.to_json() 
 
+    @staticmethod
+    def _count_account_types(business_metrics: pd.DataFrame) -> pd.Series:
+        """
+        Count account types across the comma-separated accountTypes column.
+        
+        Args:
+            business_metrics: Business metrics DataFrame
+            
+        Returns:
+            Series of counts indexed by account type, most common first
+        """
+        # Non-string values split to NaN and are dropped after exploding
+        account_types = business_metrics['accountTypes'].dropna().str.split(',').explode().dropna()
+        return account_types.str.strip().value_counts()
+    
     def _create_account_type_heatmap(self, business_metrics: pd.DataFrame) -> Dict:
         """
         Create a simple HTML table-based heatmap for account type distribution.
@@ -310,19 +313,12 @@ class HTMLReportGenerator:
             return {}
         
         try:
-            # Parse account types from the accountTypes column
-            account_types_list = []
-            for account_types_str in business_metrics['accountTypes']:
-                if pd.notna(account_types_str) and isinstance(account_types_str, str):
-                    types = [t.strip() for t in account_types_str.split(',')]
-                    account_types_list.extend(types)
+            # Count account types from the accountTypes column
+            account_type_counts = self._count_account_types(business_metrics)
             
-            if not account_types_list:
+            if account_type_counts.empty:
                 return {}
             
-            # Count account types
-            account_type_counts = pd.Series(account_types_list).value_counts()
-            
             # Define the account types in the order you specified
             account_types = ['CardFlex', 'LineRevolving', 'CardExtend', 'CardLegacy']
             
@@ -5,5 +5,11 @@ This package contains shared utility functions and common functionality
 used across different analysis modules.
 """
 
-# TODO: Add common utility functions
-__all__ = [] 
\ No newline at end of file
+from .load_cache import file_signature, get_cached_frame, load_cache_key, store_cached_frame
+
+__all__ = [
+    'file_signature',
+    'get_cached_frame',
+    'load_cache_key',
+    'store_cached_frame'
+]
\ No newline at end of file
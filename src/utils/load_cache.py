@@ -0,0 +1,54 @@
+"""
+Opt-in cache for frames loaded from data files.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Optional, OrderedDict as OrderedDictType, Sequence, Tuple
+
+import pandas as pd
+
+# Number of loaded frames kept; each entry holds a full copy of its frame
+LOAD_CACHE_MAX_ENTRIES = 4
+
+LoadCacheKey = Tuple[str, str, Optional[tuple]]
+
+# (kind, absolute path, usecols) -> ((mtime_ns, size), frame), least recently used first
+_LOAD_CACHE: OrderedDictType[LoadCacheKey, Tuple[Tuple[int, int], pd.DataFrame]] = OrderedDict()
+
+
+def load_cache_key(kind: str, file_path: str, usecols: Optional[Sequence[str]] = None) -> LoadCacheKey:
+    """Build the cache key for one kind of load of a file."""
+    return kind, os.path.abspath(file_path), tuple(usecols) if usecols else None
+
+
+def file_signature(file_path: str) -> Tuple[int, int]:
+    """Identify a file version by modification time and size."""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_cached_frame(key: LoadCacheKey, signature: Tuple[int, int]) -> Optional[pd.DataFrame]:
+    """
+    Return a copy of the cached frame if its source file is unchanged.
+
+    The copy has its own column arrays, but Python objects held in object
+    columns (such as parsed JSON dicts) are shared with the cache and must
+    not be modified in place.
+    """
+    entry = _LOAD_CACHE.get(key)
+    if entry is None:
+        return None
+    if entry[0] != signature:
+        del _LOAD_CACHE[key]
+        return None
+    _LOAD_CACHE.move_to_end(key)
+    return entry[1].copy()
+
+
+def store_cached_frame(key: LoadCacheKey, signature: Tuple[int, int], frame: pd.DataFrame) -> None:
+    """Cache a copy of a loaded frame, evicting the least recently used entries."""
+    _LOAD_CACHE[key] = (signature, frame.copy())
+    _LOAD_CACHE.move_to_end(key)
+    while len(_LOAD_CACHE) > LOAD_CACHE_MAX_ENTRIES:
+        _LOAD_CACHE.popitem(last=False)
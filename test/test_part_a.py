@@ -14,6 +14,17 @@ from src.part_1_loan_tape_analysis.loan_tape_analyzer import LoanPortfolioAnalyz
 from src.part_1_loan_tape_analysis.loan_tape_data_processor import LoanDataProcessor
 from src.part_1_loan_tape_analysis.loan_tape_metrics import PortfolioMetricsCalculator, BusinessMetricsCalculator
 
+# Global analyzer instance to avoid redundant data processing
+_analyzer = None
+
+
+def get_analyzer():
+    """Get or create a shared analyzer instance."""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = LoanPortfolioAnalyzer("assets/part-1/test_loan_tape.csv")
+    return _analyzer
+
 
 def test_data_parsing():
     """Test data parsing functionality."""
@@ -55,7 +66,7 @@ def test_analyzer_initialization():
 def test_portfolio_metrics():
     """Test portfolio metrics calculation."""
     try:
-        analyzer = LoanPortfolioAnalyzer("assets/part-1/test_loan_tape.csv")
+        analyzer = get_analyzer()
         metrics = analyzer.get_portfolio_metrics()
         
         assert metrics is not None
@@ -78,7 +89,7 @@ def test_portfolio_metrics():
 def test_business_metrics():
     """Test business metrics calculation."""
     try:
-        analyzer = LoanPortfolioAnalyzer("assets/part-1/test_loan_tape.csv")
+        analyzer = get_analyzer()
         metrics = analyzer.get_business_metrics()
         
         assert metrics is not None
@@ -95,7 +106,7 @@ def test_business_metrics():
 def test_insights():
     """Test insights generation."""
     try:
-        analyzer = LoanPortfolioAnalyzer("assets/part-1/test_loan_tape.csv")
+        analyzer = get_analyzer()
         insights = analyzer.get_insights()
         
         assert insights is not None
@@ -5,7 +5,9 @@ Tests for Part B: Orders Analysis
 
 import sys
 import os
+import tempfile
 import traceback
+import numpy as np
 import pandas as pd
 
 # Add the parent directory to the path so we can import src modules
@@ -185,11 +187,16 @@ def test_discount_logic():
         test_orders['discounts'] = test_orders['discounts'].apply(processor._parse_discounts)
         test_orders['net_revenue'] = test_orders['gross_amount'] - test_orders['refunds'] - test_orders['discounts']
         
-        # Verify calculations
-        assert test_orders['gross_amount'].sum() == 450.0
-        assert test_orders['refunds'].sum() == 30.0
-        assert test_orders['discounts'].sum() == 20.0
-        assert test_orders['net_revenue'].sum() == 400.0
+        # Verify calculations row by row: gross, refunds, discounts, net
+        expected = np.array([
+            [100.0, 10.0, 5.0, 85.0],
+            [200.0, 20.0, 15.0, 165.0],
+            [150.0, 0.0, 0.0, 150.0],
+        ])
+        actual = test_orders[['gross_amount', 'refunds', 'discounts', 'net_revenue']].to_numpy(dtype=np.float64)
+        mismatched = np.flatnonzero(~np.isclose(actual, expected, atol=1e-2).all(axis=1))
+        assert mismatched.size == 0, f"Mismatched rows: {mismatched.tolist()}"
+        assert np.allclose(actual.sum(axis=0), [450.0, 30.0, 20.0, 400.0])
         
         print("✓ Discount logic tests passed")
         return True
@@ -199,6 +206,74 @@ def test_discount_logic():
         return False
 
 
+def test_scatter_customer_aggregation():
+    """Test that the scatter-reduction customer aggregation matches the groupby path."""
+    try:
+        # The sample data is below the threshold, so force each path explicitly
+        groupby_analyzer = OrdersAnalyzer(
+            "assets/part-2/test_orders.csv",
+            "assets/part-2/test_bank_transactions.csv"
+        )
+        groupby_analyzer.SCATTER_AGG_MIN_ORDERS = sys.maxsize
+        scatter_analyzer = OrdersAnalyzer(
+            "assets/part-2/test_orders.csv",
+            "assets/part-2/test_bank_transactions.csv"
+        )
+        scatter_analyzer.SCATTER_AGG_MIN_ORDERS = 0
+        
+        expected = groupby_analyzer._calculate_customer_agg()
+        actual = scatter_analyzer._calculate_customer_agg()
+        assert len(actual) > 0
+        pd.testing.assert_frame_equal(actual, expected, check_exact=False)
+        
+        print("✓ Scatter aggregation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Scatter aggregation tests failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_load_cache_invalidation():
+    """Test that cached loads and analysis results are refreshed when their data changes."""
+    try:
+        raw_orders = pd.read_csv("assets/part-2/test_orders.csv")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            orders_path = os.path.join(tmp_dir, "orders.csv")
+            raw_orders.head(50).to_csv(orders_path, index=False)
+            
+            first = OrdersDataProcessor.load_orders_data(orders_path, cache=True)
+            assert len(first) == 50
+            
+            # Writing to a returned frame's columns must not leak into later loads
+            first.loc[:, 'net_revenue'] = -1.0
+            second = OrdersDataProcessor.load_orders_data(orders_path, cache=True)
+            assert not (second['net_revenue'] == -1.0).all()
+            
+            # Rewriting the file must bypass the cached frame
+            raw_orders.head(20).to_csv(orders_path, index=False)
+            third = OrdersDataProcessor.load_orders_data(orders_path, cache=True)
+            assert len(third) == 20
+            
+            analyzer = OrdersAnalyzer(orders_path, "assets/part-2/test_bank_transactions.csv")
+            results = analyzer.analyze_orders()
+            assert analyzer.analyze_orders()['cohort_metrics'] is results['cohort_metrics']
+            assert results['cohort_metrics']['total_orders'].sum() == 20
+            
+            # Replacing the loaded orders must drop every derived result
+            analyzer._orders_data = analyzer.orders_data.head(10)
+            refreshed = analyzer.analyze_orders()
+            assert refreshed['cohort_metrics']['total_orders'].sum() == 10
+            assert analyzer._calculate_revenue_totals()['net_revenue'] == analyzer.orders_data['net_revenue'].sum()
+        
+        print("✓ Load cache invalidation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Load cache invalidation tests failed: {e}")
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -212,7 +287,9 @@ def main():
         test_average_order_value,
         test_customer_acquisition_cost,
         test_insights,
-        test_discount_logic
+        test_discount_logic,
+        test_scatter_customer_aggregation,
+        test_load_cache_invalidation
     ]
     
     passed = 0